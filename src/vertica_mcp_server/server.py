@@ -17,13 +17,34 @@ Features:
 
 import argparse
 import asyncio
+import concurrent.futures
+import csv
+import functools
+import io
 import json
 import logging
 import os
+import re
 import sys
-import traceback
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from itertools import repeat
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 from urllib.parse import urlparse
 
 import vertica_python
@@ -33,6 +54,17 @@ from mcp.server.lowlevel import NotificationOptions
 from mcp.server.models import InitializationOptions
 from mcp.types import Resource, TextContent, Tool
 from pydantic import AnyUrl
+from vertica_python.datatypes import VerticaType
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # optional speedup, see the "speedups" extra
+    uvloop = None
 
 # Configure logging
 logging.basicConfig(
@@ -40,36 +72,378 @@ logging.basicConfig(
 )
 logger = logging.getLogger("vertica-mcp-server")
 
+T = TypeVar("T")
+
 # Configuration from environment variables
 DEBUG = os.getenv("DEBUG", "False").lower() == "true"
 DB_CONNECTION_STRING = os.getenv("DB_CONNECTION_STRING")
 COMMENT_DB_CONNECTION_STRING = os.getenv(
     "COMMENT_DB_CONNECTION_STRING", DB_CONNECTION_STRING
 )
-TABLE_WHITE_LIST = (
-    os.getenv("TABLE_WHITE_LIST", "").split(",")
-    if os.getenv("TABLE_WHITE_LIST")
-    else []
+TABLE_WHITE_LIST = frozenset(
+    name.strip() for name in os.getenv("TABLE_WHITE_LIST", "").split(",") if name.strip()
 )
-COLUMN_WHITE_LIST = (
-    os.getenv("COLUMN_WHITE_LIST", "").split(",")
-    if os.getenv("COLUMN_WHITE_LIST")
-    else []
+COLUMN_WHITE_LIST = frozenset(
+    name.strip() for name in os.getenv("COLUMN_WHITE_LIST", "").split(",") if name.strip()
 )
 QUERY_LIMIT_SIZE = int(os.getenv("QUERY_LIMIT_SIZE") or "100")
 MAX_ROWS_EXPORT = int(os.getenv("MAX_ROWS_EXPORT") or "10000")
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE") or "1")
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE") or "10")
+DB_POOL_RECYCLE_SECONDS = float(os.getenv("DB_POOL_RECYCLE_SECONDS") or "300")
+DB_POOL_MAX_INACTIVE_SECONDS = float(os.getenv("DB_POOL_MAX_INACTIVE_SECONDS") or "300")
+DB_POOL_PING_IDLE_SECONDS = float(os.getenv("DB_POOL_PING_IDLE_SECONDS") or "60")
+CATALOG_CACHE_TTL = float(os.getenv("CATALOG_CACHE_TTL") or "60")
+COLUMN_CACHE_TTL = float(os.getenv("COLUMN_CACHE_TTL") or "300")
+CATALOG_CACHE_SIZE = 256
+QUERY_CACHE_TTL = float(os.getenv("QUERY_CACHE_TTL") or "60")
+QUERY_CACHE_SIZE = 256
+# Results with more rows than this are not worth holding on to
+QUERY_CACHE_MAX_ROWS = 10000
+# Total rows held across all cached results
+QUERY_CACHE_ROW_BUDGET = 50000
+FETCH_BATCH_SIZE = 1000
+# Tables advertised individually by list_resources
+LIST_RESOURCES_LIMIT = 50
+# Whitelists larger than this are bound as one array parameter
+IN_FILTER_MAX_PARAMS = 20
+
+# Simple connection string format: host[:port]/database
+_SIMPLE_CONNECTION_RE = re.compile(r"(?P<host>[^:/]+)(?::(?P<port>\d+))?/(?P<database>[^/]+)/?\Z")
+
+# Catalog data types (without length/precision) grouped by sample query kind
+_TEXT_TYPES = frozenset({"VARCHAR", "CHAR", "LONG VARCHAR"})
+_NUMERIC_TYPES = frozenset(
+    {
+        "INT",
+        "INTEGER",
+        "BIGINT",
+        "SMALLINT",
+        "NUMERIC",
+        "DECIMAL",
+        "FLOAT",
+        "DOUBLE PRECISION",
+    }
+)
+_TEMPORAL_TYPES = frozenset({"DATE", "TIMESTAMP", "TIMESTAMPTZ"})
+# Aggregates generate_sample_queries profiles for each data type
+_STAT_AGGREGATES: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        **dict.fromkeys(_NUMERIC_TYPES, ("min", "max", "avg")),
+        **dict.fromkeys(_TEMPORAL_TYPES, ("min", "max")),
+    }
+)
+_DISTINCT_TEMPLATE = (
+    "-- Find distinct values for {c}\n"
+    "SELECT DISTINCT {c} FROM {t} WHERE {c} IS NOT NULL LIMIT 20;"
+)
+
+# Column types vertica_python returns as datetime.datetime
+_DATETIME_TYPE_CODES = frozenset({VerticaType.TIMESTAMP, VerticaType.TIMESTAMPTZ})
+
+# Catalog queries; filters and ORDER BY are appended per query shape
+_TABLES_QUERY = """
+    SELECT
+        t.table_schema,
+        t.table_name,
+        CASE
+            WHEN t.is_temp_table = 't' THEN 'TEMPORARY TABLE'
+            WHEN t.is_flextable = 't' THEN 'FLEX TABLE'
+            ELSE 'TABLE'
+        END as table_type,
+        t.is_temp_table,
+        t.is_system_table,
+        COALESCE(ps.row_count, 0) as estimated_row_count
+    FROM v_catalog.tables t
+    LEFT JOIN v_monitor.projection_storage ps ON t.table_name = ps.anchor_table_name
+    WHERE t.is_system_table = 'f'
+"""
+_COLUMNS_QUERY = """
+    SELECT
+        c.column_name,
+        c.data_type,
+        c.data_type_id,
+        c.data_type_length,
+        c.numeric_precision,
+        c.numeric_scale,
+        c.is_nullable,
+        c.column_default,
+        c.column_set_using,
+        c.ordinal_position
+    FROM v_catalog.columns c
+    WHERE c.table_name = %s
+"""
+_VIEWS_QUERY = """
+    SELECT
+        v.table_schema,
+        v.table_name,
+        v.is_system_view
+    FROM v_catalog.views v
+    WHERE v.is_system_view = 'f'
+"""
+_PROJECTIONS_QUERY = """
+    SELECT
+        p.projection_schema,
+        p.projection_name,
+        p.anchor_table_name,
+        p.is_super_projection,
+        p.is_up_to_date,
+        p.has_statistics,
+        p.created_epoch,
+        p.verified_fault_tolerance
+    FROM v_catalog.projections p
+    WHERE p.owner_name != 'release'
+      AND p.projection_schema NOT IN ('v_catalog', 'v_monitor', 'v_internal')
+"""
+
+# SQL safety checks for execute_query
+_ALLOWED_STATEMENT_RE = re.compile(r"\W*(?:SELECT|WITH|DESCRIBE|DESC|EXPLAIN)\b", re.I)
+# SELECT ... INTO creates a table, which outlives the call on pooled sessions
+_INTO_RE = re.compile(r"\bINTO\b", re.I)
+_EXPLAIN_RE = re.compile(r"\W*EXPLAIN\b", re.I)
+_SELECT_RE = re.compile(r"\bSELECT\b", re.I)
+# Parentheses and the row-limiting clauses, for finding clauses at depth 0
+_LIMIT_CLAUSE_RE = re.compile(r"[()]|\b(?:LIMIT|OFFSET)\b", re.I)
+_TRAILING_SQL_RE = re.compile(r"[\s;]*\Z")
+# Text that must never be read as keywords
+_SQL_NOISE_RE = re.compile(
+    r"--[^\n]*"  # line comment
+    r"|/\*.*?\*/"  # block comment
+    r"|(?<!\w)[Ee]'(?:[^'\\]|\\.|'')*'"  # E'' string with backslash escapes
+    r"|'(?:[^']|'')*'"  # standard string
+    r'|"(?:[^"]|"")*"'  # quoted identifier
+    r"|(?<![\w$])\$(?P<tag>(?:[A-Za-z_]\w*)?)\$.*?\$(?P=tag)\$",  # dollar-quoted string
+    re.DOTALL,
+)
+# Openers and closers left over once noise is masked, i.e. text the masker
+# could not pair up, which the safety check refuses rather than guess about
+_SQL_UNPAIRED_RE = re.compile(r"['\"]|/\*|\*/|(?<![\w$])\$(?:[A-Za-z_]\w*)?\$")
+_SQL_WORD_RE = re.compile(r"\w+")
+# Noise plus whitespace runs, for building query cache keys
+_SQL_NORMALIZE_RE = re.compile(_SQL_NOISE_RE.pattern + r"|\s+", re.DOTALL)
+# Characters with special meaning inside a STRING_TO_ARRAY literal
+_ARRAY_LITERAL_UNSAFE_RE = re.compile(r'[\[\],"\\\s]')
+
+# Result keys for catalog rows, in SELECT column order
+_TABLE_KEYS = (
+    "schema_name",
+    "table_name",
+    "table_type",
+    "is_temp_table",
+    "is_system_table",
+    "estimated_row_count",
+)
+_COLUMN_KEYS = (
+    "column_name",
+    "data_type",
+    "data_type_id",
+    "data_type_length",
+    "numeric_precision",
+    "numeric_scale",
+    "is_nullable",
+    "column_default",
+    "column_set_using",
+    "ordinal_position",
+)
+_VIEW_KEYS = ("schema_name", "view_name", "is_system_view")
+_PROJECTION_KEYS = (
+    "schema_name",
+    "projection_name",
+    "anchor_table_name",
+    "is_super_projection",
+    "is_up_to_date",
+    "has_statistics",
+    "created_epoch",
+    "verified_fault_tolerance",
+)
 
 if DEBUG:
     logging.getLogger().setLevel(logging.DEBUG)
     logger.setLevel(logging.DEBUG)
 
 
+def _rows_to_dicts(keys: Tuple[str, ...], rows: List[Any]) -> List[Dict[str, Any]]:
+    """Turn result rows into dicts keyed by column name
+
+    map/zip keep the per-row loop inside C builtins instead of a Python
+    comprehension frame.
+    """
+    return list(map(dict, map(zip, repeat(keys), rows)))
+
+
+def _in_filter(expression: str, values: FrozenSet[str]) -> Tuple[str, Tuple[str, ...]]:
+    """Build an "AND expression IN (...)" clause and its parameters
+
+    Large sets are sent as a single array literal and exploded server side,
+    unless a name contains a character the array literal cannot carry.
+    """
+    if not values:
+        return "", ()
+    names = sorted(values)
+    if len(names) > IN_FILTER_MAX_PARAMS and not any(
+        _ARRAY_LITERAL_UNSAFE_RE.search(name) for name in names
+    ):
+        return (
+            f" AND {expression} IN (SELECT value FROM"
+            " (SELECT EXPLODE(STRING_TO_ARRAY(%s)) OVER ()) AS whitelist)",
+            (f"[{','.join(names)}]",),
+        )
+    placeholders = ",".join(["%s"] * len(names))
+    return f" AND {expression} IN ({placeholders})", tuple(names)
+
+
+def _mask_sql(sql: str) -> str:
+    """Blank out comments and fill quoted text with "_", keeping every offset"""
+    return _SQL_NOISE_RE.sub(lambda m: (" " if m.group()[0] in "-/" else "_") * len(m.group()), sql)
+
+
+def _top_level_clauses(statement: str) -> FrozenSet[str]:
+    """Return the LIMIT/OFFSET clauses of a masked statement outside any parentheses"""
+    depth = 0
+    found = set()
+    for match in _LIMIT_CLAUSE_RE.finditer(statement):
+        token = match.group()
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+        elif depth == 0:
+            found.add(token.upper())
+    return frozenset(found)
+
+
+@functools.lru_cache(maxsize=1024)
+def _analyze_sql(sql: str) -> Tuple[bool, Optional[str]]:
+    """Classify SQL for execute_query as (allowed, limit_base)
+
+    Comments and quoted literals are masked first so text inside them is
+    never mistaken for a keyword, and every ";"-separated statement must be a
+    SELECT, WITH, DESCRIBE or EXPLAIN without an INTO; SQL with unterminated
+    quotes or nested comments is rejected.
+    limit_base is None when the query needs no row limit, and otherwise the
+    SQL to append " LIMIT n" to: the statement without trailing comments and
+    semicolons, wrapped in a subquery when it has a top-level OFFSET (which
+    LIMIT cannot follow).
+    """
+    masked = _mask_sql(sql)
+    # Vertica nests block comments, so text after an inner "/*" is still
+    # commented out on the server even though the masker ends the comment
+    if _SQL_UNPAIRED_RE.search(masked) or any(
+        match.group().startswith("/*") and "/*" in match.group()[2:]
+        for match in _SQL_NOISE_RE.finditer(sql)
+    ):
+        return False, None
+
+    statements = [statement for statement in masked.split(";") if _SQL_WORD_RE.search(statement)]
+
+    if not all(
+        _ALLOWED_STATEMENT_RE.match(statement) and not _INTO_RE.search(statement)
+        for statement in statements
+    ):
+        return False, None
+
+    if (
+        len(statements) != 1
+        or _EXPLAIN_RE.match(statements[0])
+        or _SELECT_RE.search(statements[0]) is None
+    ):
+        return True, None
+
+    clauses = _top_level_clauses(statements[0])
+    if "LIMIT" in clauses:
+        return True, None
+
+    base = sql[: _TRAILING_SQL_RE.search(masked).start()]
+    if "OFFSET" in clauses:
+        base = f"SELECT * FROM ({base}) AS limited"
+    return True, base
+
+
+def _normalize_sql(sql: str) -> str:
+    """Drop comments, collapse whitespace, and strip trailing semicolons
+
+    Quoted literals and identifiers are kept verbatim.
+    """
+
+    def replace(match: "re.Match[str]") -> str:
+        text = match.group()
+        return " " if text.isspace() or text.startswith(("--", "/*")) else text
+
+    return _SQL_NORMALIZE_RE.sub(replace, sql).strip().rstrip(";").strip()
+
+
+def _decode_text_rows(rows: List[List[Optional[bytes]]]) -> List[List[Optional[str]]]:
+    """Decode undecoded result values, which arrive as the server's UTF-8 text"""
+    return [
+        [None if value is None else value.decode("utf-8", "replace") for value in row]
+        for row in rows
+    ]
+
+
+def _to_json(obj: Any) -> str:
+    """Serialize a tool or resource payload compactly, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode()
+    return json.dumps(obj, default=str, separators=(",", ":"))
+
+
 class VerticaConnection:
     """Manages Vertica database connections with connection pooling"""
 
-    def __init__(self, connection_string: str):
+    __slots__ = (
+        "connection_string",
+        "connection_info",
+        "min_size",
+        "max_size",
+        "pool_recycle",
+        "max_inactive_lifetime",
+        "ping_idle_after",
+        "executor",
+        "_connect_kwargs",
+        "_queue",
+        "_slots",
+        "_fill_lock",
+        "_opened_at",
+        "_filled",
+        "_closed",
+    )
+
+    def __init__(
+        self,
+        connection_string: str,
+        min_size: int = DB_POOL_MIN_SIZE,
+        max_size: int = DB_POOL_MAX_SIZE,
+        pool_recycle: float = DB_POOL_RECYCLE_SECONDS,
+        max_inactive_lifetime: float = DB_POOL_MAX_INACTIVE_SECONDS,
+        ping_idle_after: float = DB_POOL_PING_IDLE_SECONDS,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ):
+        if max_size < 1:
+            raise ValueError("Connection pool max_size must be at least 1")
+
         self.connection_string = connection_string
         self.connection_info = self._parse_connection_string(connection_string)
+        # Frozen copy handed to every vertica_python.connect call
+        self._connect_kwargs: Mapping[str, Any] = MappingProxyType(dict(self.connection_info))
+        self.min_size = max(0, min(min_size, max_size))
+        self.max_size = max_size
+        self.pool_recycle = pool_recycle
+        self.max_inactive_lifetime = max_inactive_lifetime
+        # Connections idle at least this long are pinged before reuse
+        self.ping_idle_after = ping_idle_after
+        # vertica_python is synchronous; blocking calls run here (None uses the
+        # event loop's default executor)
+        self.executor = executor
+
+        # Idle connections as (connection, opened_at, released_at). LIFO hands out
+        # the most recently used session first and lets the rest age out.
+        self._queue: asyncio.LifoQueue[Tuple[Any, float, float]] = asyncio.LifoQueue(max_size)
+        # Caps the number of connections checked out at any one time
+        self._slots = asyncio.Semaphore(max_size)
+        self._fill_lock = asyncio.Lock()
+        self._opened_at: Dict[int, float] = {}
+        self._filled = False
+        self._closed = False
 
     def _parse_connection_string(self, connection_string: str) -> Dict[str, Any]:
         """Parse Vertica connection string into connection parameters"""
@@ -84,376 +458,863 @@ class VerticaConnection:
                 "port": parsed.port or 5433,
                 "user": parsed.username,
                 "password": parsed.password,
-                "database": parsed.path.lstrip("/") if parsed.path else None,
+                "database": parsed.path.lstrip("/") or None,
             }
-        else:
-            # Simple format: host:port/database or host/database
-            parts = connection_string.split("/")
-            if len(parts) >= 2:
-                host_port = parts[0]
-                database = parts[1]
-
-                if ":" in host_port:
-                    host, port = host_port.split(":", 1)
-                    port = int(port)
-                else:
-                    host = host_port
-                    port = 5433
 
-                return {
-                    "host": host,
-                    "port": port,
-                    "database": database,
-                    "user": os.getenv("VERTICA_USER", "dbadmin"),
-                    "password": os.getenv("VERTICA_PASSWORD", ""),
-                }
-            else:
-                raise ValueError("Invalid connection string format")
+        # Simple format: host:port/database or host/database
+        match = _SIMPLE_CONNECTION_RE.match(connection_string)
+        if match is None:
+            raise ValueError("Invalid connection string format")
+
+        return {
+            "host": match["host"],
+            "port": int(match["port"] or 5433),
+            "database": match["database"],
+            "user": os.getenv("VERTICA_USER", "dbadmin"),
+            "password": os.getenv("VERTICA_PASSWORD", ""),
+        }
+
+    async def run_in_executor(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking vertica_python call without stalling the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
 
     async def get_connection(self) -> vertica_python.Connection:
-        """Get a connection to Vertica"""
+        """Open a new, unpooled connection to Vertica"""
         try:
-            connection = vertica_python.connect(**self.connection_info)
+            connection = await self.run_in_executor(
+                lambda: vertica_python.connect(**self._connect_kwargs)
+            )
             logger.debug("Vertica connection established successfully")
             return connection
         except Exception as e:
-            logger.error(f"Failed to connect to Vertica: {e}")
+            logger.error("Failed to connect to Vertica: %s", e)
+            raise
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[vertica_python.Connection]:
+        """Check a pooled connection out for the duration of the block"""
+        conn = await self._checkout()
+        discard = False
+        try:
+            yield conn
+        except BaseException as e:
+            # Cancellation included: the executor thread may still be running
+            # a statement on conn, so it must not be rolled back or reused
+            discard = self._is_fatal(e)
+            raise
+        finally:
+            await self.release(conn, discard=discard)
+
+    async def release(self, conn: vertica_python.Connection, discard: bool = False) -> None:
+        """Return a checked-out connection to the pool, closing it if unusable"""
+        try:
+            opened_at = self._opened_at.get(id(conn), 0.0)
+            if (
+                discard
+                or self._closed
+                or conn.closed()
+                or time.monotonic() - opened_at > self.pool_recycle
+            ):
+                await self._discard(conn)
+                return
+
+            # Connections used to be closed after every call, which implicitly
+            # rolled back any open transaction. Keep that guarantee when pooling.
+            # Other session state (SET, temp tables) cannot change, as tools
+            # only run the read statements _analyze_sql lets through.
+            if conn.transaction_status != "no_transaction":
+                try:
+                    await self.run_in_executor(conn.rollback)
+                except BaseException as e:
+                    logger.debug("Discarding connection after failed rollback: %s", e)
+                    await self._discard(conn)
+                    if not isinstance(e, Exception):
+                        raise
+                    return
+
+            self._queue.put_nowait((conn, opened_at, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    async def close(self) -> None:
+        """Close all idle connections and refuse further checkouts"""
+        self._closed = True
+        while not self._queue.empty():
+            conn, _, _ = self._queue.get_nowait()
+            await self._discard(conn)
+
+    async def _checkout(self) -> vertica_python.Connection:
+        """Take a healthy idle connection from the pool or open a new one"""
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+
+        await self._fill()
+        await self._slots.acquire()
+        try:
+            while True:
+                try:
+                    conn, opened_at, released_at = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return await self._open()
+
+                now = time.monotonic()
+                if (
+                    now - opened_at > self.pool_recycle
+                    or now - released_at > self.max_inactive_lifetime
+                ):
+                    await self._discard(conn)
+                    continue
+
+                if now - released_at >= self.ping_idle_after:
+                    try:
+                        alive = await self.run_in_executor(self._ping, conn)
+                    except BaseException:
+                        # Cancelled mid-ping: conn is off the queue, so close it
+                        await self._discard(conn)
+                        raise
+                    if not alive:
+                        await self._discard(conn)
+                        continue
+
+                return conn
+        except BaseException:
+            self._slots.release()
             raise
 
+    async def _fill(self) -> None:
+        """Pre-open min_size connections on first use"""
+        if self._filled:
+            return
+
+        async with self._fill_lock:
+            if self._filled:
+                return
+
+            results = await asyncio.gather(
+                *(self._open() for _ in range(self.min_size)), return_exceptions=True
+            )
+            now = time.monotonic()
+            for result in results:
+                if isinstance(result, BaseException):
+                    # Warm-up is best effort; a checkout will surface the error
+                    logger.warning("Failed to pre-open pooled connection: %s", result)
+                else:
+                    self._queue.put_nowait((result, self._opened_at[id(result)], now))
+
+            self._filled = True
+
+    async def _open(self) -> vertica_python.Connection:
+        """Open a new connection and record its age for recycling"""
+        conn = await self.get_connection()
+        self._opened_at[id(conn)] = time.monotonic()
+        return conn
+
+    async def _discard(self, conn: vertica_python.Connection) -> None:
+        """Close a connection and forget about it"""
+        self._opened_at.pop(id(conn), None)
+        if conn.closed():
+            return
+        try:
+            await self.run_in_executor(conn.close)
+        except Exception as e:
+            logger.debug("Error closing Vertica connection: %s", e)
+
+    @staticmethod
+    def _is_fatal(error: BaseException) -> bool:
+        """Whether an error raised while using a connection leaves it unusable
+
+        Errors the server reports for a statement (syntax, missing objects,
+        permissions) leave the session intact; anything else, including
+        errors raised outside the driver mid-statement, may not.
+        """
+        return not isinstance(error, vertica_python.errors.QueryError) or isinstance(
+            error,
+            (
+                vertica_python.errors.ConnectionFailure,
+                vertica_python.errors.LostConnectivityFailure,
+            ),
+        )
+
+    @staticmethod
+    def _ping(conn: vertica_python.Connection) -> bool:
+        """Check that an idle connection is still alive"""
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+            return True
+        except Exception:
+            return False
+
 
 class DatabaseInspector:
     """Provides database schema inspection capabilities"""
 
-    def __init__(self, connection_manager: VerticaConnection):
+    def __init__(
+        self,
+        connection_manager: VerticaConnection,
+        cache_ttl: float = CATALOG_CACHE_TTL,
+        column_cache_ttl: float = COLUMN_CACHE_TTL,
+    ):
         self.connection_manager = connection_manager
+        self.cache_ttl = cache_ttl
+        # Column definitions change far less often than the table lists
+        self.column_cache_ttl = column_cache_ttl
+        # Catalog lookups keyed by (kind, *args), stored as (expires_at, result)
+        self._cache: Dict[Tuple[Any, ...], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._locks: DefaultDict[Tuple[Any, ...], asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Bumped whenever cached catalog data is thrown away
+        self.cache_generation = 0
+        # Whitelists are fixed at startup, so every catalog query shape is
+        # built once here instead of on each call
+        table_filter, self._table_filter_params = _in_filter("t.table_name", TABLE_WHITE_LIST)
+        column_filter, self._column_filter_params = _in_filter(
+            "(c.table_name || '.' || c.column_name)", COLUMN_WHITE_LIST
+        )
+        tables_order = " ORDER BY t.table_schema, t.table_name"
+        self._sql_tables = _TABLES_QUERY + table_filter + tables_order
+        self._sql_tables_by_schema = (
+            _TABLES_QUERY + " AND t.table_schema = %s" + table_filter + tables_order
+        )
+        columns_order = " ORDER BY c.ordinal_position"
+        self._sql_columns = _COLUMNS_QUERY + column_filter + columns_order
+        self._sql_columns_by_schema = (
+            _COLUMNS_QUERY + " AND c.table_schema = %s" + column_filter + columns_order
+        )
+        views_order = " ORDER BY v.table_schema, v.table_name"
+        self._sql_views = _VIEWS_QUERY + views_order
+        self._sql_views_by_schema = _VIEWS_QUERY + " AND v.table_schema = %s" + views_order
+        projections_order = " ORDER BY p.projection_schema, p.projection_name"
+        self._sql_projections = _PROJECTIONS_QUERY + projections_order
+        self._sql_projections_by_schema = (
+            _PROJECTIONS_QUERY + " AND p.projection_schema = %s" + projections_order
+        )
+
+    def clear_cache(self) -> None:
+        """Drop all cached catalog metadata"""
+        self._cache.clear()
+        self.cache_generation += 1
+
+    def invalidate(
+        self, schema_name: Optional[str] = None, table_name: Optional[str] = None
+    ) -> None:
+        """Drop cached metadata that a change to schema_name.table_name can affect
+
+        That is the table's column metadata plus the table, view, and
+        projection lists of its schema and of all schemas.
+        """
+        stale = [
+            key
+            for key in self._cache
+            if (
+                key[0] == "table_columns"
+                and (table_name is None or key[1] == table_name)
+                and (schema_name is None or key[2] in (schema_name, None))
+            )
+            or (
+                key[0] != "table_columns" and (schema_name is None or key[1] in (schema_name, None))
+            )
+        ]
+        for key in stale:
+            del self._cache[key]
+        self.cache_generation += 1
+
+    async def _cached(
+        self,
+        key: Tuple[Any, ...],
+        func: Callable[..., List[Dict[str, Any]]],
+        *args: Any,
+        ttl: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return a cached catalog lookup, running func(conn, *args) on a miss"""
+        if ttl is None:
+            ttl = self.cache_ttl
+        if ttl <= 0:
+            return await self._fetch(func, *args)
+
+        # Concurrent misses for the same key wait for a single catalog query
+        async with self._locks[key]:
+            entry = self._cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+
+            result = await self._fetch(func, *args)
+
+            self._cache.pop(key, None)
+            if len(self._cache) >= CATALOG_CACHE_SIZE:
+                oldest = next(iter(self._cache))
+                del self._cache[oldest]
+                lock = self._locks.get(oldest)
+                if lock is not None and not lock.locked():
+                    del self._locks[oldest]
+            self._cache[key] = (time.monotonic() + ttl, result)
+            return result
+
+    async def _fetch(
+        self, func: Callable[..., List[Dict[str, Any]]], *args: Any
+    ) -> List[Dict[str, Any]]:
+        """Run a synchronous catalog query on a pooled connection"""
+        async with self.connection_manager.acquire() as conn:
+            return await self.connection_manager.run_in_executor(func, conn, *args)
 
     async def get_tables(
-        self, schema_name: Optional[str] = None
+        self, schema_name: Optional[str] = None, limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
-        """Get list of tables with metadata"""
-        conn = await self.connection_manager.get_connection()
-        try:
-            cursor = conn.cursor()
+        """Get list of tables with metadata, optionally capped at limit rows"""
+        return await self._cached(
+            ("tables", schema_name, limit), self._get_tables_sync, schema_name, limit
+        )
+
+    def _get_tables_sync(
+        self,
+        conn: vertica_python.Connection,
+        schema_name: Optional[str],
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        cursor = conn.cursor()
 
-            # Base query for tables using Vertica system tables
-            query = """
-                SELECT 
-                    t.table_schema,
-                    t.table_name,
-                    CASE 
-                        WHEN t.is_temp_table = 't' THEN 'TEMPORARY TABLE'
-                        WHEN t.is_flextable = 't' THEN 'FLEX TABLE'
-                        ELSE 'TABLE'
-                    END as table_type,
-                    t.is_temp_table,
-                    t.is_system_table,
-                    COALESCE(ps.row_count, 0) as estimated_row_count
-                FROM v_catalog.tables t
-                LEFT JOIN v_monitor.projection_storage ps ON t.table_name = ps.anchor_table_name
-                WHERE t.is_system_table = 'f'
-            """
-
-            params = []
-
-            # Filter by schema if specified
-            if schema_name:
-                query += " AND t.table_schema = %s"
-                params.append(schema_name)
-
-            # Apply whitelist filter if configured
-            if TABLE_WHITE_LIST and TABLE_WHITE_LIST != [""]:
-                placeholders = ",".join(["%s"] * len(TABLE_WHITE_LIST))
-                query += f" AND t.table_name IN ({placeholders})"
-                params.extend(TABLE_WHITE_LIST)
-
-            query += " ORDER BY t.table_schema, t.table_name"
-
-            cursor.execute(query, params)
-
-            tables = []
-            for row in cursor.fetchall():
-                tables.append(
-                    {
-                        "schema_name": row[0],
-                        "table_name": row[1],
-                        "table_type": row[2],
-                        "is_temp_table": row[3],
-                        "is_system_table": row[4],
-                        "estimated_row_count": row[5],
-                    }
-                )
+        # Filter by schema if specified
+        if schema_name:
+            query = self._sql_tables_by_schema
+            params = [schema_name, *self._table_filter_params]
+        else:
+            query = self._sql_tables
+            params = list(self._table_filter_params)
 
-            return tables
+        if limit is not None:
+            query += " LIMIT %s"
+            params.append(limit)
 
-        finally:
-            conn.close()
+        cursor.execute(query, params)
+
+        return _rows_to_dicts(_TABLE_KEYS, cursor.fetchall())
 
     async def get_table_columns(
         self, table_name: str, schema_name: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Get detailed column information for a table"""
-        conn = await self.connection_manager.get_connection()
-        try:
-            cursor = conn.cursor()
-
-            query = """
-                SELECT 
-                    c.column_name,
-                    c.data_type,
-                    c.data_type_id,
-                    c.data_type_length,
-                    c.numeric_precision,
-                    c.numeric_scale,
-                    c.is_nullable,
-                    c.column_default,
-                    c.column_set_using,
-                    c.ordinal_position
-                FROM v_catalog.columns c
-                WHERE c.table_name = %s
-            """
-
-            params = [table_name]
-
-            if schema_name:
-                query += " AND c.table_schema = %s"
-                params.append(schema_name)
-
-            query += " ORDER BY c.ordinal_position"
-
-            cursor.execute(query, params)
-
-            columns = []
-            for row in cursor.fetchall():
-                # Apply column whitelist if configured
-                full_column_name = f"{table_name}.{row[0]}"
-                if COLUMN_WHITE_LIST and COLUMN_WHITE_LIST != [""]:
-                    if full_column_name not in COLUMN_WHITE_LIST:
-                        continue
-
-                columns.append(
-                    {
-                        "column_name": row[0],
-                        "data_type": row[1],
-                        "data_type_id": row[2],
-                        "data_type_length": row[3],
-                        "numeric_precision": row[4],
-                        "numeric_scale": row[5],
-                        "is_nullable": row[6],
-                        "column_default": row[7],
-                        "column_set_using": row[8],
-                        "ordinal_position": row[9],
-                    }
-                )
+        return await self._cached(
+            ("table_columns", table_name, schema_name),
+            self._get_table_columns_sync,
+            table_name,
+            schema_name,
+            ttl=self.column_cache_ttl,
+        )
+
+    def _get_table_columns_sync(
+        self,
+        conn: vertica_python.Connection,
+        table_name: str,
+        schema_name: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        cursor = conn.cursor()
 
-            return columns
+        if schema_name:
+            cursor.execute(
+                self._sql_columns_by_schema,
+                [table_name, schema_name, *self._column_filter_params],
+            )
+        else:
+            cursor.execute(self._sql_columns, [table_name, *self._column_filter_params])
 
-        finally:
-            conn.close()
+        return _rows_to_dicts(_COLUMN_KEYS, cursor.fetchall())
 
     async def get_views(
         self, schema_name: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Get list of views"""
-        conn = await self.connection_manager.get_connection()
-        try:
-            cursor = conn.cursor()
-
-            query = """
-                SELECT 
-                    v.table_schema,
-                    v.table_name,
-                    v.is_system_view
-                FROM v_catalog.views v
-                WHERE v.is_system_view = 'f'
-            """
-
-            params = []
-
-            if schema_name:
-                query += " AND v.table_schema = %s"
-                params.append(schema_name)
-
-            query += " ORDER BY v.table_schema, v.table_name"
-
-            cursor.execute(query, params)
+        return await self._cached(("views", schema_name), self._get_views_sync, schema_name)
 
-            views = []
-            for row in cursor.fetchall():
-                views.append(
-                    {
-                        "schema_name": row[0],
-                        "view_name": row[1],
-                        "is_system_view": row[2],
-                    }
-                )
+    def _get_views_sync(
+        self, conn: vertica_python.Connection, schema_name: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        cursor = conn.cursor()
 
-            return views
+        if schema_name:
+            cursor.execute(self._sql_views_by_schema, [schema_name])
+        else:
+            cursor.execute(self._sql_views, [])
 
-        finally:
-            conn.close()
+        return _rows_to_dicts(_VIEW_KEYS, cursor.fetchall())
 
     async def get_projections(
         self, schema_name: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Get list of projections (Vertica-specific)"""
-        conn = await self.connection_manager.get_connection()
-        try:
-            cursor = conn.cursor()
+        return await self._cached(
+            ("projections", schema_name), self._get_projections_sync, schema_name
+        )
 
-            query = """
-                SELECT 
-                    p.projection_schema,
-                    p.projection_name,
-                    p.anchor_table_name,
-                    p.is_super_projection,
-                    p.is_up_to_date,
-                    p.has_statistics,
-                    p.created_epoch,
-                    p.verified_fault_tolerance
-                FROM v_catalog.projections p
-                WHERE p.owner_name != 'release'
-                  AND p.projection_schema NOT IN ('v_catalog', 'v_monitor', 'v_internal')
-            """
-
-            params = []
-
-            if schema_name:
-                query += " AND p.projection_schema = %s"
-                params.append(schema_name)
-
-            query += " ORDER BY p.projection_schema, p.projection_name"
-
-            cursor.execute(query, params)
-
-            projections = []
-            for row in cursor.fetchall():
-                projections.append(
-                    {
-                        "schema_name": row[0],
-                        "projection_name": row[1],
-                        "anchor_table_name": row[2],
-                        "is_super_projection": row[3],
-                        "is_up_to_date": row[4],
-                        "has_statistics": row[5],
-                        "created_epoch": row[6],
-                        "verified_fault_tolerance": row[7],
-                    }
-                )
+    def _get_projections_sync(
+        self, conn: vertica_python.Connection, schema_name: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        cursor = conn.cursor()
 
-            return projections
+        if schema_name:
+            cursor.execute(self._sql_projections_by_schema, [schema_name])
+        else:
+            cursor.execute(self._sql_projections, [])
 
-        finally:
-            conn.close()
+        return _rows_to_dicts(_PROJECTION_KEYS, cursor.fetchall())
 
 
 class QueryExecutor:
     """Handles SQL query execution with safety controls"""
 
-    def __init__(self, connection_manager: VerticaConnection):
+    def __init__(self, connection_manager: VerticaConnection, cache_ttl: float = QUERY_CACHE_TTL):
         self.connection_manager = connection_manager
+        self.cache_ttl = cache_ttl
+        # Results keyed by (normalized sql, params, columnar, max_rows),
+        # stored as (expires_at, row_count, result)
+        self._cache: Dict[Tuple[Any, ...], Tuple[float, int, Dict[str, Any]]] = {}
+        self._cached_rows = 0
+
+    def clear_cache(self) -> None:
+        """Drop all cached query results"""
+        self._cache.clear()
+        self._cached_rows = 0
+
+    def _cache_key(
+        self,
+        sql: str,
+        params: Optional[List],
+        columnar: bool,
+        max_rows: int,
+    ) -> Optional[Tuple[Any, ...]]:
+        """Build the result cache key, or None when the query is not cacheable"""
+        if self.cache_ttl <= 0:
+            return None
+        key = (_normalize_sql(sql), tuple(params or ()), columnar, max_rows)
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable parameter values; run the query uncached
+            return None
+        return key
+
+    def _cache_store(self, key: Tuple[Any, ...], result: Dict[str, Any]) -> None:
+        """Cache a result, evicting the oldest entries to stay within budget"""
+        row_count = result.get("row_count", 0)
+        # Only row results are replayed; a "message" result means the
+        # statement ran for its effect, which must happen every time
+        if "columns" not in result or row_count > QUERY_CACHE_MAX_ROWS:
+            return
+
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._cached_rows -= entry[1]
+        while self._cache and (
+            len(self._cache) >= QUERY_CACHE_SIZE
+            or self._cached_rows + row_count > QUERY_CACHE_ROW_BUDGET
+        ):
+            self._cached_rows -= self._cache.pop(next(iter(self._cache)))[1]
+        self._cache[key] = (time.monotonic() + self.cache_ttl, row_count, result)
+        self._cached_rows += row_count
 
     async def execute_query(
-        self, sql: str, params: Optional[List] = None
+        self,
+        sql: str,
+        params: Optional[List] = None,
+        columnar: bool = False,
+        max_rows: int = QUERY_LIMIT_SIZE,
     ) -> Dict[str, Any]:
-        """Execute a SQL query with safety controls"""
+        """Execute a SQL query with safety controls
+
+        At most max_rows rows are fetched, even when the query's own LIMIT
+        allows more; "truncated" tells whether rows were left unread. With
+        columnar=True the result holds one list per column in "column_data"
+        instead of one list per row in "rows". Results answered from the cache
+        carry "cached": True.
+        """
+
+        sql = self._check_sql(sql, max_rows)
+
+        key = self._cache_key(sql, params, columnar, max_rows)
+        if key is not None:
+            entry = self._cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                # execution_time_seconds is from the run that filled the cache
+                return {**entry[2], "cached": True}
+
+        async with self.connection_manager.acquire() as conn:
+            result = await self.connection_manager.run_in_executor(
+                self._execute_query_sync,
+                conn,
+                sql,
+                params,
+                columnar,
+                max_rows,
+            )
 
-        # Basic SQL injection prevention
-        sql_upper = sql.upper().strip()
-
-        # Check for potentially dangerous operations
-        dangerous_keywords = [
-            "DROP",
-            "DELETE",
-            "TRUNCATE",
-            "ALTER",
-            "CREATE",
-            "INSERT",
-            "UPDATE",
-        ]
+        if key is not None:
+            self._cache_store(key, result)
 
-        # Allow SELECT, DESCRIBE, EXPLAIN
-        if not any(
-            sql_upper.startswith(keyword)
-            for keyword in ["SELECT", "WITH", "DESCRIBE", "DESC", "EXPLAIN"]
-        ):
-            if any(keyword in sql_upper for keyword in dangerous_keywords):
-                raise ValueError(
-                    "Only SELECT, DESCRIBE, and EXPLAIN statements are allowed"
-                )
+        return result
 
-        conn = await self.connection_manager.get_connection()
-        try:
-            cursor = conn.cursor()
+    async def export_csv(self, sql: str, max_rows: int = MAX_ROWS_EXPORT) -> Dict[str, Any]:
+        """Execute a query with the same safety controls and render it as CSV
 
-            # Set row limit for SELECT queries
-            if (
-                "SELECT" in sql_upper
-                and "LIMIT" not in sql_upper
-                and not sql_upper.startswith("EXPLAIN")
-            ):
-                # Add LIMIT for SELECT queries
-                sql += f" LIMIT {QUERY_LIMIT_SIZE}"
+        Rows are written to the CSV buffer batch by batch as they are
+        fetched, so the full result is never held as Python rows.
+        """
+        sql = self._check_sql(sql, max_rows)
 
-            start_time = datetime.now()
+        async with self.connection_manager.acquire() as conn:
+            return await self.connection_manager.run_in_executor(
+                self._export_csv_sync, conn, sql, max_rows
+            )
 
-            if params:
-                cursor.execute(sql, params)
-            else:
-                cursor.execute(sql)
+    @staticmethod
+    def _check_sql(sql: str, max_rows: int) -> str:
+        """Reject unsafe SQL and apply the row limit to SELECT queries"""
+        # Basic SQL injection prevention
+        allowed, limit_base = _analyze_sql(sql)
+        if not allowed:
+            raise ValueError("Only SELECT, DESCRIBE, and EXPLAIN statements are allowed")
+
+        # Set row limit for SELECT queries without a top-level LIMIT
+        if limit_base is not None:
+            sql = f"{limit_base} LIMIT {max_rows}"
+
+        return sql
+
+    def _execute_query_sync(
+        self,
+        conn: vertica_python.Connection,
+        sql: str,
+        params: Optional[List],
+        columnar: bool,
+        max_rows: int,
+    ) -> Dict[str, Any]:
+        cursor = conn.cursor()
+        result = self._run_query(cursor, sql, params, columnar, max_rows)
+        if result.get("truncated"):
+            self._drop_unread_rows(conn)
+        return result
+
+    @staticmethod
+    def _drop_unread_rows(conn: vertica_python.Connection) -> None:
+        """Close a connection whose result set was not read to the end
+
+        The server keeps streaming the remaining rows, and the driver would
+        read them all before the next statement on this session; closing it
+        lets the pool discard it on release instead.
+        """
+        try:
+            conn.close()
+        except Exception as e:
+            logger.debug("Error closing Vertica connection: %s", e)
+
+    def _run_query(
+        self,
+        cursor: vertica_python.vertica.cursor.Cursor,
+        sql: str,
+        params: Optional[List],
+        columnar: bool,
+        max_rows: int,
+    ) -> Dict[str, Any]:
+        start_time = time.perf_counter()
 
-            execution_time = (datetime.now() - start_time).total_seconds()
+        if params:
+            cursor.execute(sql, params)
+        else:
+            cursor.execute(sql)
 
-            # Fetch results
-            if cursor.description:
-                columns = [desc[0] for desc in cursor.description]
-                rows = cursor.fetchall()
-
-                # Convert to JSON-serializable format
-                serializable_rows = []
-                for row in rows:
-                    serializable_row = []
-                    for value in row:
-                        if isinstance(value, datetime):
-                            serializable_row.append(value.isoformat())
-                        else:
-                            serializable_row.append(value)
-                    serializable_rows.append(serializable_row)
+        execution_time = time.perf_counter() - start_time
+
+        # Fetch results
+        if cursor.description:
+            columns = [desc[0] for desc in cursor.description]
+            datetime_columns = [
+                i for i, desc in enumerate(cursor.description) if desc[1] in _DATETIME_TYPE_CODES
+            ]
+
+            # Fetch in batches, converting each one to a JSON-serializable
+            # format as it arrives; only datetime columns need it. One row
+            # past max_rows is read to tell whether the result was cut short.
+            rows: List[Any] = []
+            truncated = False
+            while True:
+                batch = cursor.fetchmany(min(FETCH_BATCH_SIZE, max_rows + 1 - len(rows)))
+                if not batch:
+                    break
+                if not columnar:
+                    for i in datetime_columns:
+                        for row in batch:
+                            if row[i] is not None:
+                                row[i] = row[i].isoformat()
+                rows.extend(batch)
+                if len(rows) > max_rows:
+                    del rows[max_rows:]
+                    truncated = True
+                    break
+
+            if columnar:
+                column_data = [list(values) for values in zip(*rows)] or [[] for _ in columns]
+                for i in datetime_columns:
+                    column_data[i] = [
+                        value.isoformat() if value is not None else None for value in column_data[i]
+                    ]
 
                 return {
                     "columns": columns,
-                    "rows": serializable_rows,
+                    "column_data": column_data,
                     "row_count": len(rows),
+                    "truncated": truncated,
                     "execution_time_seconds": execution_time,
                     "query": sql,
                 }
-            else:
-                return {
-                    "message": "Query executed successfully",
-                    "execution_time_seconds": execution_time,
-                    "query": sql,
-                }
 
+            return {
+                "columns": columns,
+                "rows": rows,
+                "row_count": len(rows),
+                "truncated": truncated,
+                "execution_time_seconds": execution_time,
+                "query": sql,
+            }
+        else:
+            return {
+                "message": "Query executed successfully",
+                "execution_time_seconds": execution_time,
+                "query": sql,
+            }
+
+    def _export_csv_sync(
+        self, conn: vertica_python.Connection, sql: str, max_rows: int
+    ) -> Dict[str, Any]:
+        cursor = conn.cursor()
+        # CSV is text anyway, so take values as the server formats them
+        # instead of decoding into Python objects first
+        cursor.disable_sqldata_converter = True
+        try:
+            start_time = time.perf_counter()
+            cursor.execute(sql)
+            execution_time = time.perf_counter() - start_time
+
+            buf = io.StringIO()
+            writer = csv.writer(buf, lineterminator="\n")
+            row_count = 0
+            truncated = False
+            if cursor.description:
+                writer.writerow([desc[0] for desc in cursor.description])
+                while True:
+                    batch = cursor.fetchmany(min(FETCH_BATCH_SIZE, max_rows + 1 - row_count))
+                    if not batch:
+                        break
+                    if row_count + len(batch) > max_rows:
+                        del batch[max_rows - row_count :]
+                        truncated = True
+                    writer.writerows(_decode_text_rows(batch))
+                    row_count += len(batch)
+                    if truncated:
+                        break
         finally:
-            conn.close()
+            cursor.disable_sqldata_converter = False
+        if truncated:
+            self._drop_unread_rows(conn)
+
+        return {
+            "csv": buf.getvalue(),
+            "row_count": row_count,
+            "truncated": truncated,
+            "execution_time_seconds": execution_time,
+            "query": sql,
+        }
 
     async def explain_query(self, sql: str) -> Dict[str, Any]:
         """Get execution plan for a query"""
-        conn = await self.connection_manager.get_connection()
-        try:
-            cursor = conn.cursor()
-
-            # Use Vertica's EXPLAIN syntax
-            explain_sql = f"EXPLAIN {sql}"
-            cursor.execute(explain_sql)
-
-            plan_rows = []
-            for row in cursor.fetchall():
-                plan_rows.append({"plan_line": row[0]})
-
-            return {"execution_plan": plan_rows}
+        async with self.connection_manager.acquire() as conn:
+            return await self.connection_manager.run_in_executor(
+                self._explain_query_sync, conn, sql
+            )
 
-        finally:
-            conn.close()
+    def _explain_query_sync(self, conn: vertica_python.Connection, sql: str) -> Dict[str, Any]:
+        cursor = conn.cursor()
+
+        # Use Vertica's EXPLAIN syntax
+        explain_sql = f"EXPLAIN {sql}"
+        cursor.execute(explain_sql)
+
+        plan_rows = []
+        for row in cursor.fetchall():
+            plan_rows.append({"plan_line": row[0]})
+
+        return {"execution_plan": plan_rows}
+
+
+# Shared by the list_* tools, which all take the same optional schema filter
+_SCHEMA_FILTER_INPUT: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "schema_name": {
+            "type": "string",
+            "description": "Filter by schema name (optional)",
+            "default": None,
+        }
+    },
+}
+
+# Tool and resource descriptors are static, so build (and validate) them once
+_TOOLS: List[Tool] = [
+    Tool(
+        name="execute_query",
+        description="Execute a SQL query against the Vertica database. Only SELECT, DESCRIBE, and EXPLAIN statements are allowed for safety.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sql": {
+                    "type": "string",
+                    "description": "SQL query to execute (SELECT, DESCRIBE, or EXPLAIN only)",
+                },
+                "params": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional parameters for parameterized queries",
+                    "default": [],
+                },
+                "columnar": {
+                    "type": "boolean",
+                    "description": (
+                        "Return one list per column in column_data instead of one list per row"
+                    ),
+                    "default": False,
+                },
+            },
+            "required": ["sql"],
+        },
+    ),
+    Tool(
+        name="describe_table",
+        description="Get detailed information about a table including columns, data types, and constraints",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_name": {
+                    "type": "string",
+                    "description": "Name of the table to describe",
+                },
+                "schema_name": {
+                    "type": "string",
+                    "description": "Schema name (optional)",
+                    "default": None,
+                },
+            },
+            "required": ["table_name"],
+        },
+    ),
+    Tool(
+        name="list_tables",
+        description="List all tables in the database with metadata",
+        inputSchema=_SCHEMA_FILTER_INPUT,
+    ),
+    Tool(
+        name="list_views",
+        description="List all views in the database",
+        inputSchema=_SCHEMA_FILTER_INPUT,
+    ),
+    Tool(
+        name="list_projections",
+        description="List all projections in the database (Vertica-specific)",
+        inputSchema=_SCHEMA_FILTER_INPUT,
+    ),
+    Tool(
+        name="explain_query",
+        description="Get the execution plan for a SQL query to analyze performance",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sql": {
+                    "type": "string",
+                    "description": "SQL query to explain",
+                }
+            },
+            "required": ["sql"],
+        },
+    ),
+    Tool(
+        name="generate_sample_queries",
+        description=(
+            "Generate sample SQL queries for a given table to help with exploration, "
+            "with min/max/avg statistics for its numeric and date columns"
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_name": {
+                    "type": "string",
+                    "description": "Name of the table to generate queries for",
+                },
+                "schema_name": {
+                    "type": "string",
+                    "description": "Schema name (optional)",
+                    "default": None,
+                },
+            },
+            "required": ["table_name"],
+        },
+    ),
+    Tool(
+        name="export_query_results",
+        description="Export query results in various formats (JSON, CSV)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sql": {
+                    "type": "string",
+                    "description": "SQL query to execute and export",
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["json", "csv"],
+                    "description": "Export format",
+                    "default": "json",
+                },
+            },
+            "required": ["sql"],
+        },
+    ),
+    Tool(
+        name="refresh_catalog",
+        description=(
+            "Clear cached table, view, projection, and column metadata so the next lookup "
+            "reads the live catalog. Pass a schema and/or table to refresh only what a "
+            "change to it can affect."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "schema_name": {
+                    "type": "string",
+                    "description": "Only refresh metadata for this schema",
+                },
+                "table_name": {
+                    "type": "string",
+                    "description": "Only refresh column metadata for this table",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="clear_query_cache",
+        description=(
+            "Clear cached execute_query results (identical queries are otherwise answered "
+            f"from cache for {QUERY_CACHE_TTL:g} seconds)"
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+]
+
+_OVERVIEW_RESOURCE = Resource(
+    uri=AnyUrl("vertica://schema/overview"),
+    name="Database Schema Overview",
+    description="Complete overview of database tables, views, and projections",
+    mimeType="application/json",
+)
 
 
 class VerticaMCPServer:
@@ -461,9 +1322,47 @@ class VerticaMCPServer:
 
     def __init__(self):
         self.server = Server("vertica-database")
-        self.connection_manager = VerticaConnection(DB_CONNECTION_STRING)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=16, thread_name_prefix="vertica"
+        )
+        self.connection_manager = VerticaConnection(DB_CONNECTION_STRING, executor=self._executor)
         self.inspector = DatabaseInspector(self.connection_manager)
         self.executor = QueryExecutor(self.connection_manager)
+        # Catalog cache generation and table list the resources were built
+        # from, and the resources themselves
+        self._resources: Optional[Tuple[int, List[Dict[str, Any]], List[Resource]]] = None
+        # Serialized payloads with the generation and catalog lists each was built from
+        self._json_cache: Dict[
+            Tuple[Any, ...], Tuple[int, Tuple[List[Dict[str, Any]], ...], str]
+        ] = {}
+
+    async def close(self):
+        """Release database resources held by the server"""
+        await self.connection_manager.close()
+        self._executor.shutdown(wait=False)
+
+    def _cached_json(
+        self,
+        key: Tuple[Any, ...],
+        build: Callable[[], Dict[str, Any]],
+        *sources: List[Dict[str, Any]],
+    ) -> str:
+        """Serialize build(), reusing the text while its catalog sources are unchanged"""
+        generation = self.inspector.cache_generation
+        entry = self._json_cache.get(key)
+        if (
+            entry is not None
+            and entry[0] == generation
+            and all(old is new for old, new in zip(entry[1], sources))
+        ):
+            return entry[2]
+
+        text = _to_json(build())
+        self._json_cache.pop(key, None)
+        if len(self._json_cache) >= CATALOG_CACHE_SIZE:
+            del self._json_cache[next(iter(self._json_cache))]
+        self._json_cache[key] = (generation, sources, text)
+        return text
 
     async def setup_handlers(self):
         """Setup MCP server handlers"""
@@ -475,20 +1374,23 @@ class VerticaMCPServer:
 
             try:
                 # Get database schema information
-                tables = await self.inspector.get_tables()
+                tables = await self.inspector.get_tables(limit=LIST_RESOURCES_LIMIT)
+
+                # The inspector returns the same list until its cache expires or
+                # is invalidated, so the resources built from it can be reused
+                generation = self.inspector.cache_generation
+                if (
+                    self._resources is not None
+                    and self._resources[0] == generation
+                    and self._resources[1] is tables
+                ):
+                    return self._resources[2]
 
                 # Add schema overview resource
-                resources.append(
-                    Resource(
-                        uri=AnyUrl("vertica://schema/overview"),
-                        name="Database Schema Overview",
-                        description="Complete overview of database tables, views, and projections",
-                        mimeType="application/json",
-                    )
-                )
+                resources.append(_OVERVIEW_RESOURCE)
 
                 # Add individual table resources
-                for table in tables[:50]:  # Limit to first 50 tables
+                for table in tables:
                     table_uri = (
                         f"vertica://table/{table['schema_name']}.{table['table_name']}"
                     )
@@ -501,8 +1403,10 @@ class VerticaMCPServer:
                         )
                     )
 
+                self._resources = (generation, tables, resources)
+
             except Exception as e:
-                logger.error(f"Error listing resources: {e}")
+                logger.error("Error listing resources: %s", e)
 
             return resources
 
@@ -514,23 +1418,28 @@ class VerticaMCPServer:
 
             try:
                 if uri_str == "vertica://schema/overview":
-                    # Return complete schema overview
-                    tables = await self.inspector.get_tables()
-                    views = await self.inspector.get_views()
-                    projections = await self.inspector.get_projections()
-
-                    overview = {
-                        "database_type": "Vertica",
-                        "tables": tables,
-                        "views": views,
-                        "projections": projections,
-                        "table_count": len(tables),
-                        "view_count": len(views),
-                        "projection_count": len(projections),
-                        "generated_at": datetime.now().isoformat(),
-                    }
+                    # Return complete schema overview; the lookups are independent
+                    # so run them concurrently on separate pooled connections
+                    tables, views, projections = await asyncio.gather(
+                        self.inspector.get_tables(),
+                        self.inspector.get_views(),
+                        self.inspector.get_projections(),
+                    )
 
-                    return json.dumps(overview, indent=2, default=str)
+                    def overview() -> Dict[str, Any]:
+                        return {
+                            "database_type": "Vertica",
+                            "tables": tables,
+                            "views": views,
+                            "projections": projections,
+                            "table_count": len(tables),
+                            "view_count": len(views),
+                            "projection_count": len(projections),
+                            "generated_at": datetime.now(timezone.utc).isoformat(),
+                        }
+
+                    # Reused until any of the catalog lists is refreshed
+                    return self._cached_json((uri_str,), overview, tables, views, projections)
 
                 elif uri_str.startswith("vertica://table/"):
                     # Return specific table information
@@ -546,163 +1455,29 @@ class VerticaMCPServer:
                         table_name, schema_name
                     )
 
-                    table_info = {
-                        "schema_name": schema_name,
-                        "table_name": table_name,
-                        "columns": columns,
-                        "column_count": len(columns),
-                        "generated_at": datetime.now().isoformat(),
-                    }
+                    def table_info() -> Dict[str, Any]:
+                        return {
+                            "schema_name": schema_name,
+                            "table_name": table_name,
+                            "columns": columns,
+                            "column_count": len(columns),
+                            "generated_at": datetime.now(timezone.utc).isoformat(),
+                        }
 
-                    return json.dumps(table_info, indent=2, default=str)
+                    return self._cached_json((uri_str,), table_info, columns)
 
                 else:
                     raise ValueError(f"Unknown resource URI: {uri_str}")
 
             except Exception as e:
-                logger.error(f"Error reading resource {uri_str}: {e}")
+                logger.error("Error reading resource %s: %s", uri_str, e)
                 raise
 
         @self.server.list_tools()
         async def handle_list_tools() -> list[Tool]:
             """List available database tools"""
 
-            return [
-                Tool(
-                    name="execute_query",
-                    description="Execute a SQL query against the Vertica database. Only SELECT, DESCRIBE, and EXPLAIN statements are allowed for safety.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "sql": {
-                                "type": "string",
-                                "description": "SQL query to execute (SELECT, DESCRIBE, or EXPLAIN only)",
-                            },
-                            "params": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Optional parameters for parameterized queries",
-                                "default": [],
-                            },
-                        },
-                        "required": ["sql"],
-                    },
-                ),
-                Tool(
-                    name="describe_table",
-                    description="Get detailed information about a table including columns, data types, and constraints",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "table_name": {
-                                "type": "string",
-                                "description": "Name of the table to describe",
-                            },
-                            "schema_name": {
-                                "type": "string",
-                                "description": "Schema name (optional)",
-                                "default": None,
-                            },
-                        },
-                        "required": ["table_name"],
-                    },
-                ),
-                Tool(
-                    name="list_tables",
-                    description="List all tables in the database with metadata",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "schema_name": {
-                                "type": "string",
-                                "description": "Filter by schema name (optional)",
-                                "default": None,
-                            }
-                        },
-                    },
-                ),
-                Tool(
-                    name="list_views",
-                    description="List all views in the database",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "schema_name": {
-                                "type": "string",
-                                "description": "Filter by schema name (optional)",
-                                "default": None,
-                            }
-                        },
-                    },
-                ),
-                Tool(
-                    name="list_projections",
-                    description="List all projections in the database (Vertica-specific)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "schema_name": {
-                                "type": "string",
-                                "description": "Filter by schema name (optional)",
-                                "default": None,
-                            }
-                        },
-                    },
-                ),
-                Tool(
-                    name="explain_query",
-                    description="Get the execution plan for a SQL query to analyze performance",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "sql": {
-                                "type": "string",
-                                "description": "SQL query to explain",
-                            }
-                        },
-                        "required": ["sql"],
-                    },
-                ),
-                Tool(
-                    name="generate_sample_queries",
-                    description="Generate sample SQL queries for a given table to help with exploration",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "table_name": {
-                                "type": "string",
-                                "description": "Name of the table to generate queries for",
-                            },
-                            "schema_name": {
-                                "type": "string",
-                                "description": "Schema name (optional)",
-                                "default": None,
-                            },
-                        },
-                        "required": ["table_name"],
-                    },
-                ),
-                Tool(
-                    name="export_query_results",
-                    description="Export query results in various formats (JSON, CSV)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "sql": {
-                                "type": "string",
-                                "description": "SQL query to execute and export",
-                            },
-                            "format": {
-                                "type": "string",
-                                "enum": ["json", "csv"],
-                                "description": "Export format",
-                                "default": "json",
-                            },
-                        },
-                        "required": ["sql"],
-                    },
-                ),
-            ]
+            return _TOOLS
 
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
@@ -712,14 +1487,11 @@ class VerticaMCPServer:
                 if name == "execute_query":
                     sql = arguments.get("sql")
                     params = arguments.get("params", [])
+                    columnar = arguments.get("columnar", False)
 
-                    result = await self.executor.execute_query(sql, params)
+                    result = await self.executor.execute_query(sql, params, columnar)
 
-                    return [
-                        TextContent(
-                            type="text", text=json.dumps(result, indent=2, default=str)
-                        )
-                    ]
+                    return [TextContent(type="text", text=_to_json(result))]
 
                 elif name == "describe_table":
                     table_name = arguments.get("table_name")
@@ -736,11 +1508,7 @@ class VerticaMCPServer:
                         "column_count": len(columns),
                     }
 
-                    return [
-                        TextContent(
-                            type="text", text=json.dumps(result, indent=2, default=str)
-                        )
-                    ]
+                    return [TextContent(type="text", text=_to_json(result))]
 
                 elif name == "list_tables":
                     schema_name = arguments.get("schema_name")
@@ -749,7 +1517,9 @@ class VerticaMCPServer:
                     return [
                         TextContent(
                             type="text",
-                            text=json.dumps({"tables": tables}, indent=2, default=str),
+                            text=self._cached_json(
+                                (name, schema_name), lambda: {"tables": tables}, tables
+                            ),
                         )
                     ]
 
@@ -760,7 +1530,9 @@ class VerticaMCPServer:
                     return [
                         TextContent(
                             type="text",
-                            text=json.dumps({"views": views}, indent=2, default=str),
+                            text=self._cached_json(
+                                (name, schema_name), lambda: {"views": views}, views
+                            ),
                         )
                     ]
 
@@ -771,8 +1543,10 @@ class VerticaMCPServer:
                     return [
                         TextContent(
                             type="text",
-                            text=json.dumps(
-                                {"projections": projections}, indent=2, default=str
+                            text=self._cached_json(
+                                (name, schema_name),
+                                lambda: {"projections": projections},
+                                projections,
                             ),
                         )
                     ]
@@ -781,11 +1555,7 @@ class VerticaMCPServer:
                     sql = arguments.get("sql")
                     result = await self.executor.explain_query(sql)
 
-                    return [
-                        TextContent(
-                            type="text", text=json.dumps(result, indent=2, default=str)
-                        )
-                    ]
+                    return [TextContent(type="text", text=_to_json(result))]
 
                 elif name == "generate_sample_queries":
                     table_name = arguments.get("table_name")
@@ -805,80 +1575,106 @@ class VerticaMCPServer:
                         f"-- Count total rows\nSELECT COUNT(*) FROM {table_ref};",
                     ]
 
-                    # Add column-specific queries
+                    # Add column-specific queries; numeric and date columns are
+                    # profiled together in one statement instead of one each
+                    profiled = []
                     for col in columns[:5]:  # Limit to first 5 columns
                         col_name = col["column_name"]
-                        data_type = col["data_type"]
+                        # The catalog reports e.g. "varchar(80)" or "numeric(10,2)"
+                        data_type = col["data_type"].split("(", 1)[0].strip().upper()
 
-                        if data_type in ["VARCHAR", "CHAR", "LONG VARCHAR"]:
-                            queries.append(
-                                f"-- Find distinct values for {col_name}\nSELECT DISTINCT {col_name} FROM {table_ref} WHERE {col_name} IS NOT NULL LIMIT 20;"
-                            )
-                        elif data_type in ["INT", "INTEGER", "NUMERIC", "FLOAT"]:
-                            queries.append(
-                                f"-- Statistics for {col_name}\nSELECT MIN({col_name}), MAX({col_name}), AVG({col_name}) FROM {table_ref};"
-                            )
-                        elif data_type in ["DATE", "TIMESTAMP", "TIMESTAMPTZ"]:
-                            queries.append(
-                                f"-- Date range for {col_name}\nSELECT MIN({col_name}), MAX({col_name}) FROM {table_ref};"
-                            )
+                        if data_type in _TEXT_TYPES:
+                            queries.append(_DISTINCT_TEMPLATE.format(c=col_name, t=table_ref))
+                        elif data_type in _STAT_AGGREGATES:
+                            profiled.append((col_name, _STAT_AGGREGATES[data_type]))
 
                     result = {"table_name": table_name, "sample_queries": queries}
 
-                    return [
-                        TextContent(
-                            type="text", text=json.dumps(result, indent=2, default=str)
+                    if profiled:
+                        aggregates = ", ".join(
+                            f"{stat.upper()}({col_name})"
+                            for col_name, stats in profiled
+                            for stat in stats
                         )
-                    ]
+                        stats_sql = f"SELECT {aggregates} FROM {table_ref}"
+                        queries.append(
+                            f"-- Statistics for {', '.join(c for c, _ in profiled)}\n{stats_sql};"
+                        )
+
+                        try:
+                            stats_result = await self.executor.execute_query(stats_sql)
+                        except vertica_python.errors.Error as e:
+                            # The sample queries are still useful without a profile
+                            logger.warning("Could not profile %s: %s", table_ref, e)
+                        else:
+                            values = iter(stats_result["rows"][0])
+                            result["column_stats"] = {
+                                col_name: {stat: next(values) for stat in stats}
+                                for col_name, stats in profiled
+                            }
+
+                    return [TextContent(type="text", text=_to_json(result))]
 
                 elif name == "export_query_results":
                     sql = arguments.get("sql")
                     format_type = arguments.get("format", "json")
 
-                    result = await self.executor.execute_query(sql)
-
                     if format_type == "csv":
-                        # Convert to CSV format
-                        csv_lines = []
-                        csv_lines.append(",".join(result["columns"]))
-
-                        for row in result["rows"]:
-                            csv_row = []
-                            for value in row:
-                                if value is None:
-                                    csv_row.append("")
-                                else:
-                                    # Escape commas and quotes
-                                    str_value = str(value)
-                                    if "," in str_value or '"' in str_value:
-                                        str_value = (
-                                            '"' + str_value.replace('"', '""') + '"'
-                                        )
-                                    csv_row.append(str_value)
-                            csv_lines.append(",".join(csv_row))
-
-                        csv_content = "\n".join(csv_lines)
+                        result = await self.executor.export_csv(sql)
+                        truncated = ", truncated" if result["truncated"] else ""
 
                         return [
                             TextContent(
                                 type="text",
-                                text=f"CSV Export ({result['row_count']} rows):\n\n{csv_content}",
+                                text=(
+                                    f"CSV Export ({result['row_count']} rows{truncated}):"
+                                    f"\n\n{result['csv']}"
+                                ),
                             )
                         ]
                     else:
+                        result = await self.executor.execute_query(sql, max_rows=MAX_ROWS_EXPORT)
+
                         return [
                             TextContent(
                                 type="text",
-                                text=json.dumps(result, indent=2, default=str),
+                                text=_to_json(result),
                             )
                         ]
 
+                elif name == "clear_query_cache":
+                    self.executor.clear_cache()
+
+                    return [
+                        TextContent(
+                            type="text",
+                            text=_to_json({"message": "Query cache cleared"}),
+                        )
+                    ]
+
+                elif name == "refresh_catalog":
+                    schema_name = arguments.get("schema_name")
+                    table_name = arguments.get("table_name")
+
+                    if schema_name or table_name:
+                        self.inspector.invalidate(schema_name, table_name)
+                    else:
+                        self.inspector.clear_cache()
+                    self._json_cache.clear()
+
+                    return [
+                        TextContent(
+                            type="text",
+                            text=_to_json({"message": "Catalog cache cleared"}),
+                        )
+                    ]
+
                 else:
                     raise ValueError(f"Unknown tool: {name}")
 
             except Exception as e:
-                logger.error(f"Error calling tool {name}: {e}")
-                logger.error(traceback.format_exc())
+                logger.error("Error calling tool %s: %s", name, e)
+                logger.debug("Traceback:", exc_info=True)
 
                 return [TextContent(type="text", text=f"Error: {str(e)}")]
 
@@ -914,10 +1710,11 @@ async def async_main():
     except KeyboardInterrupt:
         logger.info("Server interrupted by user")
     except Exception as e:
-        logger.error(f"Server error: {e}")
-        logger.error(traceback.format_exc())
+        logger.error("Server error: %s", e)
+        logger.debug("Traceback:", exc_info=True)
         sys.exit(1)
     finally:
+        await server.close()
         logger.info("Vertica MCP Server shutdown complete")
 
 
@@ -933,8 +1730,11 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
         logger.setLevel(logging.DEBUG)
 
-    # Run the async main function
-    asyncio.run(async_main())
+    # Run the async main function, on uvloop when it is installed
+    if uvloop is not None:
+        uvloop.run(async_main())
+    else:
+        asyncio.run(async_main())
 
 
 if __name__ == "__main__":
@@ -2,20 +2,125 @@
 Pytest configuration and fixtures for Vertica MCP Server tests
 """
 
-import pytest
 import os
-from unittest.mock import MagicMock, patch
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+
+# Import the package from this checkout's src, ahead of any installed copy
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Database the integration tests run against unless DB_CONNECTION_STRING is set
+INTEGRATION_CONNECTION_STRING = "vertica://dbadmin:@localhost:5433/testdb"
+
+
+class FakeCursor:
+    """Minimal stand-in for a vertica_python cursor
+
+    Each execute() starts reading a fresh copy of rows. on_execute, when set,
+    is called with the operation first, so a test can make it fail or block.
+    """
+
+    def __init__(self, rows=None, description=None):
+        self.rows = list(rows or [])
+        self.description = description
+        self.executed = []
+        # Size of each fetchmany() call, None for fetchall()
+        self.fetches = []
+        self.on_execute = None
+        self.disable_sqldata_converter = False
+        self._pending = []
+
+    def execute(self, operation, parameters=None):
+        self.executed.append((operation, parameters))
+        if self.on_execute is not None:
+            self.on_execute(operation)
+        self._pending = [list(row) for row in self.rows]
+
+    def fetchone(self):
+        return self._pending.pop(0) if self._pending else None
+
+    def fetchmany(self, size=None):
+        self.fetches.append(size)
+        batch, self._pending = self._pending[:size], self._pending[size:]
+        return batch
+
+    def fetchall(self):
+        self.fetches.append(None)
+        rows, self._pending = self._pending, []
+        return rows
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """Minimal stand-in for a vertica_python connection with a single cursor"""
+
+    def __init__(self, cursor=None):
+        self._cursor = cursor or FakeCursor()
+        self.transaction_status = "no_transaction"
+        self.is_closed = False
+        self.close_count = 0
+        self.rollback_count = 0
+
+    def cursor(self):
+        return self._cursor
+
+    def closed(self):
+        return self.is_closed
+
+    def close(self):
+        self.is_closed = True
+        self.close_count += 1
+
+    def rollback(self):
+        self.rollback_count += 1
 
 
 @pytest.fixture
 def mock_vertica_connection():
-    """Mock Vertica connection for testing"""
+    """Fake Vertica connection and cursor returned by vertica_python.connect"""
     with patch('vertica_python.connect') as mock_connect:
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_connect.return_value = mock_conn
-        yield mock_conn, mock_cursor
+        fake_conn = FakeConnection()
+        mock_connect.return_value = fake_conn
+        yield fake_conn, fake_conn.cursor()
+
+
+@pytest.fixture
+def fake_connect():
+    """Patch vertica_python.connect to open a new FakeConnection per call
+
+    Cursors return fake_connect.rows, and the connections opened so far are
+    kept in order in fake_connect.connections.
+    """
+    with patch('vertica_python.connect') as mock_connect:
+        mock_connect.rows = []
+        mock_connect.connections = []
+
+        def connect(**kwargs):
+            conn = FakeConnection(FakeCursor(mock_connect.rows))
+            mock_connect.connections.append(conn)
+            return conn
+
+        mock_connect.side_effect = connect
+        yield mock_connect
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mcp_server():
+    """VerticaMCPServer with handlers registered, shared by the integration tests"""
+    from vertica_mcp_server.server import VerticaMCPServer
+
+    connection_string = os.getenv("DB_CONNECTION_STRING") or INTEGRATION_CONNECTION_STRING
+    with patch("vertica_mcp_server.server.DB_CONNECTION_STRING", connection_string):
+        srv = VerticaMCPServer()
+    await srv.setup_handlers()
+    yield srv
+    await srv.close()
 
 
 @pytest.fixture
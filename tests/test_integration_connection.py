@@ -3,21 +3,18 @@
 Test script to verify Vertica MCP Server connection and functionality
 """
 
-import os
+import asyncio
+
 import pytest
-from vertica_mcp_server.server import VerticaMCPServer
 
-@pytest.mark.asyncio
+
+@pytest.mark.asyncio(loop_scope="session")
 @pytest.mark.integration
-async def test_connection():
+async def test_connection(mcp_server):
     """Test basic database connection and tools"""
     
-    # Set up environment
-    os.environ["DB_CONNECTION_STRING"] = "vertica://dbadmin:@localhost:5433/testdb"
-    
     try:
-        # Create server instance
-        server = VerticaMCPServer()
+        server = mcp_server
         
         # Test database connection
         print("Testing database connection...")
@@ -30,13 +27,14 @@ async def test_connection():
         
         # Test inspector functionality
         print("\nTesting database inspector...")
-        tables = await server.inspector.get_tables()
+        # Independent lookups, each on its own pooled connection
+        tables, views, projections = await asyncio.gather(
+            server.inspector.get_tables(),
+            server.inspector.get_views(),
+            server.inspector.get_projections(),
+        )
         print(f"✓ Found {len(tables)} tables")
-        
-        views = await server.inspector.get_views()
         print(f"✓ Found {len(views)} views")
-        
-        projections = await server.inspector.get_projections()
         print(f"✓ Found {len(projections)} projections")
         
         # Test table columns
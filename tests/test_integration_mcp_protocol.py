@@ -3,29 +3,22 @@
 Test script to verify MCP protocol communication with the Vertica MCP Server
 """
 
-import os
 import json
+
 import pytest
 from pydantic import AnyUrl
-from vertica_mcp_server.server import VerticaMCPServer
 
-@pytest.mark.asyncio
+
+@pytest.mark.asyncio(loop_scope="session")
 @pytest.mark.integration
-async def test_mcp_protocol():
+async def test_mcp_protocol(mcp_server):
     """Test MCP protocol communication"""
     
-    # Set up environment
-    os.environ["DB_CONNECTION_STRING"] = "vertica://dbadmin:@localhost:5433/testdb"
-    
     print("=== Testing MCP Protocol Communication ===\n")
     
     try:
-        # Import after setting environment
-        from vertica_mcp_server.server import VerticaMCPServer
-        
-        # Create server instance  
-        server = VerticaMCPServer()
-        await server.setup_handlers()
+        # Handlers are registered once by the session fixture
+        server = mcp_server
         
         print("1. Testing list_tools...")
         tools = await server.server._list_tools_handler()
@@ -3,21 +3,16 @@
 Test script to verify Vertica MCP Server tools functionality
 """
 
-import os
 import pytest
-from vertica_mcp_server.server import VerticaMCPServer
 
-@pytest.mark.asyncio
+
+@pytest.mark.asyncio(loop_scope="session")
 @pytest.mark.integration
-async def test_tools():
+async def test_tools(mcp_server):
     """Test all MCP server tools"""
     
-    # Set up environment
-    os.environ["DB_CONNECTION_STRING"] = "vertica://dbadmin:@localhost:5433/testdb"
-    
     try:
-        # Create server instance
-        server = VerticaMCPServer()
+        server = mcp_server
         
         print("=== Testing MCP Server Tools ===\n")
         